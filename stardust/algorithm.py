@@ -1,5 +1,6 @@
 import math
 import os
+from functools import lru_cache
 import numpy as np
 import random
 
@@ -13,58 +14,81 @@ def linstep(start, stop, step):
 		step (float): The spacing between values.
 	
 	Returns:
-		list: Values from start to stop (inclusive).
+		np.ndarray: Values from start to stop (inclusive).
 	"""
 	
 	# Error check step size
 	if step <= 0:
 		raise ValueError("step must be positive")
 	
-	# Generate list
+	# Generate array in one vectorized pass
 	n_steps = int(math.floor((stop - start) / step))
-	values = [start + i * step for i in range(n_steps + 1)]
+	values = start + step * np.arange(n_steps + 1, dtype=np.float64)
 	
 	# Ensure exact inclusion of stop (handles floating point rounding issues)
-	if values[-1] < stop or math.isclose(values[-1], stop):
-		values.append(stop)
+	if math.isclose(values[-1], stop):
+		values[-1] = stop
+	elif values[-1] < stop:
+		values = np.append(values, stop)
 	
 	return values
 
+@lru_cache(maxsize=64)
+def _norm_exts(exts:tuple) -> frozenset:
+	""" Lowercased set of extensions, cached per unique `exts` tuple. """
+	return frozenset(e.lower() for e in exts)
+
 def has_ext(path:str, exts:list):
 	''' Checks if the given path ends with any of the provided extensions.
 	
 	Args:
 		path (str): Path to file whose extension to check.
-		exts (list): List of strings. If any match the file extension, will
-			return True.
+		exts (list): List or tuple of strings. If any match the file extension,
+			will return True.
 	
 	Returns:
 		(bool): True if the file matches any of the provided extensions.
 	
 	'''
-	return os.path.splitext(path)[1].lower() in [e.lower() for e in exts]
+	return os.path.splitext(path)[1].lower() in _norm_exts(tuple(exts))
 
 def bounded_interp(x, y, x_target):
 	''' Interpolation with protection such that None is returned if requested
-	value is out of bounds.
+	value is out of bounds. If `x_target` is an array, an array is returned
+	with out of bounds values set to NaN.
 	'''
 	
-	if x_target < x[0] or x_target > x[-1]:
-		return None
-	return np.interp(x_target, x, y)
+	xt = np.asarray(x_target)
+	out = np.interp(xt, x, y)
+	mask = (xt < x[0]) | (xt > x[-1])
+	
+	# Scalar target
+	if out.ndim == 0:
+		return None if mask else float(out)
+	
+	out[mask] = np.nan
+	return out
 
-def randrangef(xmin:float, xmax:float, step:float=None):
+def randrangef(xmin:float, xmax:float, step:float=None, n:int=None):
 	""" Returns a random number between 'xmin' and 'xmax' with
-	steps of 'step' enforced.
+	steps of 'step' enforced. Steps are counted from 'xmin'.
 	
 	if step = None, will not force any steps
+	if n is provided, returns a numpy array of n values instead of a float
 	"""
 	
+	# Vectorized path for bulk generation
+	if n is not None:
+		values = np.random.uniform(xmin, xmax, n)
+		if step is not None:
+			values = np.round((values - xmin)/step)*step + xmin
+		return values
+	
 	# Get float value in range
-	value = random.random()*(xmax - xmin) + xmin
+	value = random.uniform(xmin, xmax)
 	
 	# Round to a given step
 	if step is not None:
-		value = round(value/step)*step
+		value = round((value - xmin)/step)*step + xmin
 	
-	return value
\ No newline at end of file
+	return value
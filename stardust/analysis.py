@@ -3,28 +3,147 @@ from matplotlib.collections import PathCollection
 from typing import Dict, Any, List
 from matplotlib.figure import Figure
 
+try:
+	from numba import njit
+	HAS_NUMBA = True
+except ImportError:
+	HAS_NUMBA = False
+	
+	def njit(*args, **kwargs):
+		""" Fallback decorator used when numba is not installed. Returns the
+		function unchanged so it runs as plain Python. """
+		if len(args) == 1 and callable(args[0]) and not kwargs:
+			return args[0]
+		return lambda func: func
+
 def _finite_xy(x, y):
-	x = np.asarray(x, dtype=float)
-	y = np.asarray(y, dtype=float)
-	m = np.isfinite(x) & np.isfinite(y)
+	# Skip the conversion when the data is already a float64 array
+	if not (isinstance(x, np.ndarray) and x.dtype == np.float64):
+		x = np.asarray(x, dtype=np.float64)
+	if not (isinstance(y, np.ndarray) and y.dtype == np.float64):
+		y = np.asarray(y, dtype=np.float64)
+	
+	# Build the finite mask in a single buffer
+	m = np.isfinite(x)
+	m &= np.isfinite(y)
 	return x[m], y[m]
 
-def _segment_bound_intersections(x0, y0, x1, y1, xlow, xhigh):
-	"""Return boundary intersection points (in segment order) if the segment crosses xlow/xhigh."""
+@njit(cache=True)
+def _trim_line_kernel(x, y, xlow, xhigh, out_x, out_y):
+	"""
+	Core segment scan for `_trim_line_to_xbounds`. Writes the kept points and
+	boundary intersections into the pre-allocated `out_x`/`out_y` buffers and
+	returns the number of points written.
+	"""
+	count = 0
+	
+	# Scratch buffers for one segment: start, two intersections, end
+	seg_x = np.empty(4)
+	seg_y = np.empty(4)
+	t_b = np.empty(2)
+	x_b = np.empty(2)
+	
+	for i in range(x.size - 1):
+		x0 = x[i]
+		y0 = y[i]
+		x1 = x[i+1]
+		y1 = y[i+1]
+		n_seg = 0
+		
+		if xlow <= x0 <= xhigh:
+			seg_x[n_seg] = x0
+			seg_y[n_seg] = y0
+			n_seg += 1
+		
+		# Boundary intersections (0, 1 or 2), in order along the segment. Skip
+		# segments lying entirely below xlow or entirely above xhigh.
+		lo0 = x0 < xlow
+		lo1 = x1 < xlow
+		hi0 = x0 > xhigh
+		hi1 = x1 > xhigh
+		dx = x1 - x0
+		if not ((lo0 and lo1) or (hi0 and hi1)) and dx != 0 and np.isfinite(dx):
+			n_b = 0
+			
+			# Only check a bound if the segment changes sides of it
+			if lo0 != lo1 and x0 != xlow and x1 != xlow:
+				t = (xlow - x0) / dx
+				if 0.0 <= t <= 1.0:
+					t_b[n_b] = t
+					x_b[n_b] = xlow
+					n_b += 1
+			if hi0 != hi1 and x0 != xhigh and x1 != xhigh:
+				t = (xhigh - x0) / dx
+				if 0.0 <= t <= 1.0:
+					t_b[n_b] = t
+					x_b[n_b] = xhigh
+					n_b += 1
+			
+			if n_b == 2 and t_b[1] < t_b[0]:
+				t_b[0], t_b[1] = t_b[1], t_b[0]
+				x_b[0], x_b[1] = x_b[1], x_b[0]
+			for j in range(n_b):
+				seg_x[n_seg] = x_b[j]
+				seg_y[n_seg] = y0 + t_b[j] * (y1 - y0)
+				n_seg += 1
+		
+		if xlow <= x1 <= xhigh:
+			seg_x[n_seg] = x1
+			seg_y[n_seg] = y1
+			n_seg += 1
+		
+		# Append to output, avoiding duplicate joins
+		for j in range(n_seg):
+			if count == 0 or seg_x[j] != out_x[count-1] or seg_y[j] != out_y[count-1]:
+				out_x[count] = seg_x[j]
+				out_y[count] = seg_y[j]
+				count += 1
+	
+	return count
+
+def _trim_line_vectorized(x, y, xlow, xhigh):
+	"""
+	Numpy equivalent of `_trim_line_kernel`, used when numba is unavailable.
+	Returns the kept points and boundary intersections in segment order.
+	"""
+	x0, x1 = x[:-1], x[1:]
+	y0, y1 = y[:-1], y[1:]
 	dx = x1 - x0
-	if dx == 0 or not np.isfinite(dx):
-		return []
-	pts = []
-	for bound in (xlow, xhigh):
-		# Does the segment cross this vertical line?
-		if (x0 < bound and x1 > bound) or (x0 > bound and x1 < bound):
-			t = (bound - x0) / dx
-			if 0.0 <= t <= 1.0:
-				yb = y0 + t * (y1 - y0)
-				pts.append((t, bound, yb))
-	# ensure in-segment order
-	pts.sort(key=lambda p: p[0])
-	return [(xb, yb) for _, xb, yb in pts]
+	seg = np.arange(x.size - 1)
+	
+	# Original points inside the bounds, ordered by (point index, t=0)
+	in_mask = (x >= xlow) & (x <= xhigh)
+	pt_idx = np.flatnonzero(in_mask)
+	
+	# Segments crossing each bound (in either direction)
+	cross_lo = (x0 < xlow) ^ (x1 < xlow)
+	cross_lo &= (x0 != xlow) & (x1 != xlow)
+	cross_hi = (x0 > xhigh) ^ (x1 > xhigh)
+	cross_hi &= (x0 != xhigh) & (x1 != xhigh)
+	
+	t_lo = np.divide(xlow - x0, dx, out=np.zeros_like(dx), where=(dx != 0))
+	t_hi = np.divide(xhigh - x0, dx, out=np.zeros_like(dx), where=(dx != 0))
+	cross_lo &= (t_lo >= 0.0) & (t_lo <= 1.0)
+	cross_hi &= (t_hi >= 0.0) & (t_hi <= 1.0)
+	
+	t_lo = t_lo[cross_lo]
+	t_hi = t_hi[cross_hi]
+	yb_lo = y0[cross_lo] + t_lo * (y1[cross_lo] - y0[cross_lo])
+	yb_hi = y0[cross_hi] + t_hi * (y1[cross_hi] - y0[cross_hi])
+	
+	# Interleave points and intersections by (segment index, t)
+	out_x = np.concatenate((x[pt_idx], np.full(t_lo.size, xlow, dtype=float), np.full(t_hi.size, xhigh, dtype=float)))
+	out_y = np.concatenate((y[pt_idx], yb_lo, yb_hi))
+	key_seg = np.concatenate((pt_idx, seg[cross_lo], seg[cross_hi]))
+	key_t = np.concatenate((np.zeros(pt_idx.size), t_lo, t_hi))
+	order = np.lexsort((key_t, key_seg))
+	out_x = out_x[order]
+	out_y = out_y[order]
+	
+	# Drop consecutive duplicates (segment joins)
+	keep = np.ones(out_x.size, dtype=bool)
+	keep[1:] = (out_x[1:] != out_x[:-1]) | (out_y[1:] != out_y[:-1])
+	return out_x[keep], out_y[keep]
 
 def _trim_line_to_xbounds(x, y, xlow, xhigh):
 	"""
@@ -36,35 +155,24 @@ def _trim_line_to_xbounds(x, y, xlow, xhigh):
 		# nothing to interpolate; just keep if inside
 		m = (x >= xlow) & (x <= xhigh)
 		return x[m], y[m]
-
-	out_x: List[float] = []
-	out_y: List[float] = []
-
-	for i in range(len(x) - 1):
-		x0, y0 = x[i],   y[i]
-		x1, y1 = x[i+1], y[i+1]
-		x0_in = (xlow <= x0 <= xhigh)
-		x1_in = (xlow <= x1 <= xhigh)
-
-		seg_pts = []
-		if x0_in:
-			seg_pts.append((x0, y0))
-
-		# add boundary intersections (0, 1 or 2), in order along the segment
-		seg_pts += _segment_bound_intersections(x0, y0, x1, y1, xlow, xhigh)
-
-		if x1_in:
-			seg_pts.append((x1, y1))
-
-		# append to output, avoiding duplicate joins
-		for (xs, ys) in seg_pts:
-			if not out_x or xs != out_x[-1] or ys != out_y[-1]:
-				out_x.append(xs)
-				out_y.append(ys)
-
+	
+	if HAS_NUMBA:
+		# Worst case every segment contributes both bounds plus its endpoints
+		out_x = np.empty(2 * x.size + 2)
+		out_y = np.empty(2 * x.size + 2)
+		count = _trim_line_kernel(np.ascontiguousarray(x), np.ascontiguousarray(y), float(xlow), float(xhigh), out_x, out_y)
+		out_x = out_x[:count]
+		out_y = out_y[:count]
+	else:
+		out_x, out_y = _trim_line_vectorized(x, y, xlow, xhigh)
+	
 	# Final safety filter (numeric noise, exact inclusivity)
-	m = (np.asarray(out_x) >= xlow) & (np.asarray(out_x) <= xhigh)
-	return np.asarray(out_x)[m], np.asarray(out_y)[m]
+	m = (out_x >= xlow) & (out_x <= xhigh)
+	return out_x[m], out_y[m]
+
+# Pay the JIT compilation cost once at import
+if HAS_NUMBA:
+	_trim_line_to_xbounds(np.array([0.0, 2.0]), np.array([0.0, 1.0]), 0.5, 1.5)
 
 def extract_visible_xy(fig: Figure) -> List[Dict[str, Any]]:
 	"""
@@ -112,13 +220,18 @@ def extract_visible_xy(fig: Figure) -> List[Dict[str, Any]]:
 			offs = col.get_offsets()
 			if offs is None or len(offs) == 0:
 				continue
-			offs = np.asarray(offs, dtype=float)
+			offs = np.asarray(offs, dtype=np.float64)
 			if offs.ndim != 2 or offs.shape[1] != 2:
 				continue
+			# Column views, no copy
 			xs = offs[:, 0]
 			ys = offs[:, 1]
-			xs, ys = _finite_xy(xs, ys)
-			m = (xs >= xlow) & (xs <= xhigh)
+			
+			# Finite and in-bounds mask, built in one buffer before any gather
+			m = np.isfinite(xs)
+			m &= np.isfinite(ys)
+			m &= xs >= xlow
+			m &= xs <= xhigh
 			results.append({
 				'axes_index': ax_i,
 				'type': 'scatter',
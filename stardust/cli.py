@@ -1,7 +1,11 @@
 import textwrap
-from itertools import groupby
+import re
+from functools import lru_cache
 import json
 import copy
+import os
+import shutil
+import tempfile
 from pathlib import Path
 
 import math
@@ -26,6 +30,9 @@ _SI_PREFIXES = {
 	24:  "Y",
 }
 
+# Powers of ten for each engineering exponent, so rde avoids a pow per call
+_POW10 = {e: 10 ** e for e in _SI_PREFIXES}
+
 def rde(
 	x: float,
 	sigfigs: int = 3,
@@ -61,7 +68,8 @@ def rde(
 
 	# Engineering exponent
 	exp = int(math.floor(math.log10(x) / 3) * 3)
-	mant = x / (10 ** exp)
+	pow10 = _POW10.get(exp)
+	mant = x / (pow10 if pow10 is not None else 10 ** exp)
 
 	# Significant-figure rounding
 	digits = sigfigs - int(math.floor(math.log10(mant))) - 1
@@ -94,56 +102,49 @@ def rd(x:float, num_decimals:int=2):
 	if x is None:
 		return "NaN"
 	
-	return f"{round(x*10**num_decimals)/(10**num_decimals)}"
+	return f"{round(float(x), num_decimals)}"
+
+@lru_cache(maxsize=32)
+def _target_re(targets:str):
+	""" Returns a compiled regex matching any single character in `targets`. """
+	return re.compile(f"[{re.escape(targets)}]")
 
 def ensureWhitespace(s:str, targets:str, whitespace_list:str=" \t", pad_char=" "):
-	""" """
+	""" Pads each target character in `s` with `pad_char` wherever it is not
+	already bordered by whitespace (or the start/end of the string). """
 	
-	# Remove duplicate targets
-	targets = "".join(set(targets))
+	if not targets:
+		return s
 	
-	# Add whitespace around each target
-	for tc in targets:
+	tgt_set = set(targets)
+	ws_set = set(whitespace_list)
+	n = len(s)
+	
+	def pad_target(m):
+		i = m.start()
+		ch = m.group()
 		
-		start_index = 0
+		# Check if need to pad before target. A preceding target will already
+		# have padded after itself.
+		before = ""
+		if i > 0:
+			prev = s[i-1]
+			if prev in tgt_set and ch not in ws_set:
+				prev = pad_char
+			if prev not in ws_set:
+				before = pad_char
 		
-		# Find all instances of target
-		while True:
-			
-			# Find next instance of target
-			try:
-				idx = s[start_index:].index(tc)
-				idx += start_index
-			except ValueError as e:
-				break # Break when no more instances
-			
-			# Update start index
-			start_index = idx + 1
-			
-			# Check if need to pad before target
-			add0 = True
-			if idx == 0:
-				add0 = False
-			elif s[idx-1] in whitespace_list:
-				add0 = False
-			
-			# Check if need to pad after target
-			addf = True
-			if idx >= len(s)-1:
-				addf = False
-			elif s[idx+1] in whitespace_list:
-				addf = False
-			
-			# Add required pad characters
-			if addf:
-				s = s[:idx+1] + pad_char + s[idx+1:]
-				start_index += 1 # Don't scan pad characters
-			if add0:
-				s = s[:idx] + pad_char + s[idx:]
+		# Check if need to pad after target
+		after = pad_char if i+1 < n and s[i+1] not in ws_set else ""
+		
+		return before + ch + after
 	
-	return s
+	# Locate every target in a single regex scan
+	return _target_re("".join(sorted(tgt_set))).sub(pad_target, s)
 
 class StringIdx():
+	__slots__ = ('str', 'idx', 'idx_end')
+	
 	def __init__(self, val:str, idx:int, idx_end:int=-1):
 		self.str = val
 		self.idx = idx
@@ -152,26 +153,19 @@ class StringIdx():
 	def __str__(self):
 		return f"[{self.idx}]\"{self.str}\""
 
-	def __repr__(self):
-		return self.__str__()
+	__repr__ = __str__
+
+@lru_cache(maxsize=32)
+def _non_delim_re(delims:str):
+	""" Returns a compiled regex matching runs of characters not in `delims`. """
+	if not delims:
+		return re.compile(r".+", re.DOTALL)
+	return re.compile(f"[^{re.escape(delims)}]+")
 
 def parse_idx(input:str, delims:str=" ", keep_delims:str=""):
 	""" Parses a string, breaking it up into an array of words. Separates at delims. """
 	
-	def parse_two_idx(input:str, delims:str):
-		p = 0
-		for k, g in groupby(input, lambda x:x in delims):
-			q = p + sum(1 for i in g)
-			if not k:
-				yield (p, q) # or p, q-1 if you are really sure you want that
-			p = q
-	
-	out = []
-	
-	sections = list(parse_two_idx(input, delims))
-	for s in sections:
-		out.append(StringIdx(input[s[0]:s[1]], s[0], s[1]))
-	return out
+	return [StringIdx(m.group(), m.start(), m.end()) for m in _non_delim_re(delims).finditer(input)]
 
 def barstr(text:str, width:int=80, bc:str='*', pad:bool=True):
 
@@ -181,33 +175,42 @@ def barstr(text:str, width:int=80, bc:str='*', pad:bool=True):
 		if pad:
 			s = " " + s + " ";
 
-		pad_back = False;
-		while len(s) < width:
-			if pad_back:
-				s = s + bc
-			else:
-				s = bc + s
-			pad_back = not pad_back
+		need = width - len(s)
+		if need <= 0 or not bc:
+			return s
 
-		return s
+		# Number of whole bc strings needed to reach width. Split them,
+		# starting on front for odd counts
+		k = -(-need // len(bc))
+		n_front = (k + 1) // 2
+		n_back = k // 2
+
+		return bc * n_front + s + bc * n_back
+
+@lru_cache(maxsize=8)
+def _wrapper(width:int) -> textwrap.TextWrapper:
+	""" Returns a TextWrapper for the given width, reused across calls. """
+	return textwrap.TextWrapper(width=width)
 
 def wrap_text(text:str, width:int=80):
 	""" Accepts a string, and wraps it over multiple lines. Honors line breaks. Returns a single string."""
 	
-	# Break at \n and form list of strings without \n
-	split_lines = text.splitlines()
-	
-	all_lines = []
-	
-	# Loop over each split string, apply standard wrap
-	for sl in split_lines:
-		
-		wt = textwrap.wrap(sl, width=width)
-		for wtl in wt:
-			all_lines.append(wtl)
+	# Wrap each line (split at \n) with a shared wrapper, then join with newlines
+	tw = _wrapper(width)
+	return '\n'.join(line for sl in text.splitlines() for line in tw.wrap(sl))
+
+def _copy_settings(settings:dict) -> dict:
+	""" Copies a settings dict-of-dicts two levels deep. Only container leaf
+	values are deep-copied, which avoids the generic deepcopy machinery for
+	the common case of scalar settings. """
 	
-	# Join with newline characters
-	return '\n'.join(all_lines)
+	out = {}
+	for k, v in settings.items():
+		if type(v) is dict:
+			out[k] = {kk: (copy.deepcopy(vv) if isinstance(vv, (list, dict)) else vv) for kk, vv in v.items()}
+		else:
+			out[k] = copy.deepcopy(v)
+	return out
 
 class SettingsCLI:
 	"""
@@ -222,7 +225,7 @@ class SettingsCLI:
 	}
 	"""
 	
-	def __init__(self, settings_file: str | Path, autosave: bool = False, temp_settings:dict={}):
+	def __init__(self, settings_file: str | Path, autosave: bool = False, temp_settings:dict|None=None):
 		'''
 		Provide a settings_file to be able to save settings. Otherwise, set None for settings_file and
 		provide data to temp_settings. If a settings_file is provided, temp_settings is ignored.
@@ -230,23 +233,48 @@ class SettingsCLI:
 		
 		if settings_file is not None:
 			self.settings_file = Path(settings_file)
-			self.settings = self._load_settings()
+			self._settings = self._load_settings()
 			self.autosave = autosave
 		else:
 			self.settings_file = settings_file
-			self.settings = temp_settings
+			self._settings = temp_settings if temp_settings is not None else {}
 			self.autosave = False
 		
-		self._original_settings = copy.deepcopy(self.settings)
+		# Snapshot of last saved state, taken lazily before settings can first
+		# be changed (including through entries handed out by get/settings)
+		self._original_settings = None
+	
+	def _snapshot(self):
+		''' Records the current settings as the state to revert to on undo, if
+		not already recorded since the last save.'''
+		
+		if self._original_settings is None:
+			self._original_settings = _copy_settings(self._settings)
+	
+	@property
+	def settings(self) -> dict:
+		''' Settings dict. It can be edited in place, so the undo state is
+		recorded before it is handed out.'''
+		
+		self._snapshot()
+		return self._settings
+	
+	@settings.setter
+	def settings(self, value:dict):
+		self._snapshot()
+		self._settings = value
 	
 	def get(self, param:str):
 		''' Attempts to access parameter. Returns None if not 
 		present, then creates field for that entry.'''
 		
-		if param in self.settings:
-			return self.settings[param]
+		# Entries are returned mutable, so record the undo state first
+		self._snapshot()
+		
+		if param in self._settings:
+			return self._settings[param]
 		else:
-			self.settings[param] = None
+			self._settings[param] = None
 			return None
 	
 	def _load_settings(self) -> dict:
@@ -260,18 +288,38 @@ class SettingsCLI:
 		with self.settings_file.open("r", encoding="utf-8") as f:
 			return json.load(f)
 	
-	def save(self):
+	def save(self, pretty:bool=True):
+		''' Writes settings to file. Set pretty to False for compact output
+		(used by autosave), which lets json use its C encoder. The file is
+		written to a temporary file first and then moved into place.'''
 		
 		if self.settings_file is None:
 			print(f"Cannot save when in temporary mode.")
 			return
 		
-		with self.settings_file.open("w", encoding="utf-8") as f:
-			json.dump(self.settings, f, indent=2)
-		self._original_settings = copy.deepcopy(self.settings)
+		# Replace the real file, so a symlinked settings file stays a symlink
+		target = self.settings_file.resolve()
+		
+		fd, tmp_path = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.", suffix=".tmp")
+		try:
+			with os.fdopen(fd, "w", encoding="utf-8") as f:
+				if pretty:
+					json.dump(self._settings, f, indent=2)
+				else:
+					json.dump(self._settings, f, separators=(",", ":"))
+			if target.exists():
+				shutil.copymode(target, tmp_path) # keep permissions
+			os.replace(tmp_path, target)
+		except BaseException:
+			os.unlink(tmp_path)
+			raise
+		self._original_settings = None
 	
 	def undo(self):
-		self.settings = copy.deepcopy(self._original_settings)
+		if self._original_settings is None:
+			return # No changes since last save
+		self._settings = self._original_settings
+		self._original_settings = None
 	
 	def _print_help(self):
 		print("""
@@ -286,15 +334,15 @@ Settings CLI commands:
 """)
 	
 	def _list_settings(self):
-		for k, v in self.settings.items():
+		for k, v in self._settings.items():
 			print(f"{k:20} = {v['value']}  ({v['desc']})")
 	
 	def _show_setting(self, name):
-		if name not in self.settings:
+		if name not in self._settings:
 			print(f"Unknown setting: {name}")
 			return
 		
-		s = self.settings[name]
+		s = self._settings[name]
 		print(name)
 		print(f"  value: {s['value']} ({type(s['value']).__name__})")
 		print(f"  desc : {s['desc']}")
@@ -351,23 +399,24 @@ Settings CLI commands:
 				name = parts[1]
 				value_str = " ".join(parts[2:])
 				
-				if name not in self.settings:
+				if name not in self._settings:
 					print(f"Unknown setting: {name}")
 					continue
 				
 				try:
-					old = self.settings[name]["value"]
+					old = self._settings[name]["value"]
 					new = self._parse_value(old, value_str)
 				except Exception as e:
 					print(f"Error: {e}")
 					continue
 				
-				self.settings[name]["value"] = new
+				self._snapshot()
+				self._settings[name]["value"] = new
 				dirty = True
 				print(f"{name} set to {new}")
 				
 				if self.autosave:
-					self.save()
+					self.save(pretty=False)
 					dirty = False
 			
 			elif action == "save":
@@ -2,17 +2,59 @@ from colorama import Fore, Style
 import sys
 import os
 import string
+import textwrap
 import h5py
 import time
 import numpy as np
 import json
 
 import base64
+import itertools
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, Any
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from cryptography.hazmat.primitives import hashes
 from cryptography.fernet import Fernet, InvalidToken
 
+# Number of bytes of a drive ID file checked by locate_drive
+_ID_FILE_READ_BYTES = 4096
+
+# Mount points and drives known not to hold an ID file are remembered by
+# locate_drive for this many seconds
+_MOUNT_CACHE_TTL = 5.0
+_MOUNT_CACHE: dict[str, tuple[float, list[str]]] = {}
+_NEGATIVE_FILE_CACHE: dict[tuple[str, str, str], float] = {}
+
+def _mounts_under(mount_root:str) -> list[str]:
+	''' Returns the mounted directories directly under `mount_root`, using
+	the cached list if it is younger than _MOUNT_CACHE_TTL.
+	'''
+	
+	now = time.monotonic()
+	cached = _MOUNT_CACHE.get(mount_root)
+	if cached is not None and now - cached[0] < _MOUNT_CACHE_TTL:
+		return cached[1]
+	
+	mounts = []
+	try:
+		with os.scandir(mount_root) as it:
+			for entry in it:
+				if entry.is_dir(follow_symlinks=False) and os.path.ismount(entry.path):
+					mounts.append(entry.path)
+	except OSError:
+		pass # Mount root does not exist
+	
+	_MOUNT_CACHE[mount_root] = (now, mounts)
+	return mounts
+
+def _clear_locate_drive_cache():
+	''' Forgets all cached mount points and negative ID file lookups. '''
+	_MOUNT_CACHE.clear()
+	_NEGATIVE_FILE_CACHE.clear()
+
 def locate_drive(id:str, param:str="ID", filename="drive_id.txt", silence_output:bool=False):
 	''' Returns the path to a drive containing the file `filename`, 
 	which contains a line defining <param>=<id>. Used to identify a
@@ -28,44 +70,58 @@ def locate_drive(id:str, param:str="ID", filename="drive_id.txt", silence_output
 		else:
 			print(s)
 	
+	def has_id_file(root:str, filename:str, file_contents:str) -> bool:
+		''' Checks if `root` contains `filename` with a matching line. '''
+		
+		file_path = os.path.join(root, filename)
+		if not os.path.isfile(file_path):
+			return False
+		
+		# ID files are tiny, so compare lines from one sized read
+		try:
+			with open(file_path, 'rb') as file:
+				data = file.read(_ID_FILE_READ_BYTES)
+		except OSError as e:
+			bprint(f"Error reading {file_path}: {e}", silence=silence_output)
+			return False
+		
+		target = file_contents.encode('utf-8')
+		return any(line.strip() == target for line in data.splitlines())
+	
 	def scan_drives_windows(filename, file_contents):
-		matching_drives = []
-		# Check all potential drive letters (A to Z)
-		for drive_letter in string.ascii_uppercase:
+		
+		# Get bitmask of mounted drive letters in one call, rather than probing A to Z
+		try:
+			import ctypes
+			mask = ctypes.windll.kernel32.GetLogicalDrives()
+			drive_letters = [dl for i, dl in enumerate(string.ascii_uppercase) if mask >> i & 1]
+		except (ImportError, AttributeError, OSError):
+			drive_letters = [dl for dl in string.ascii_uppercase if os.path.exists(f"{dl}:\\")]
+		
+		# Return on first match
+		for drive_letter in drive_letters:
 			drive = f"{drive_letter}:\\"
-			if os.path.exists(drive):
-				file_path = os.path.join(drive, filename)
-				if os.path.isfile(file_path):
-					try:
-						with open(file_path, 'r', encoding='utf-8') as file:
-							for line in file:
-								if line.strip() == file_contents:
-									matching_drives.append(drive)
-									break
-					except Exception as e:
-						bprint(f"Error reading {file_path}: {e}", silence=silence_output)
-		return matching_drives
+			if has_id_file(drive, filename, file_contents):
+				return [drive]
+		return []
 	
 	def scan_drives_unix(filename, file_contents):
 		possible_mount_points = ['/mnt', '/media', '/Volumes']
-		matching_mounts = []
-
+		
 		for mount_root in possible_mount_points:
-			if os.path.exists(mount_root):
-				for entry in os.listdir(mount_root):
-					mount_path = os.path.join(mount_root, entry)
-					if os.path.ismount(mount_path):
-						file_path = os.path.join(mount_path, filename)
-						if os.path.isfile(file_path):
-							try:
-								with open(file_path, 'r', encoding='utf-8') as file:
-									for line in file:
-										if line.strip() == file_contents:
-											matching_mounts.append(mount_path)
-											break
-							except Exception as e:
-								bprint(f"Error reading {file_path}: {e}", silence=silence_output)
-		return matching_mounts
+			for path in _mounts_under(mount_root):
+				
+				# Skip drives recently found not to hold the ID file
+				neg_key = (path, filename, file_contents)
+				checked = _NEGATIVE_FILE_CACHE.get(neg_key)
+				if checked is not None and time.monotonic() - checked < _MOUNT_CACHE_TTL:
+					continue
+				
+				# Return on first match
+				if has_id_file(path, filename, file_contents):
+					return [path]
+				_NEGATIVE_FILE_CACHE[neg_key] = time.monotonic()
+		return []
 	
 	if sys.platform == "win32":
 		drives = scan_drives_windows(filename, file_contents=file_contents)
@@ -80,13 +136,109 @@ def locate_drive(id:str, param:str="ID", filename="drive_id.txt", silence_output
 		return None
 	
 	drv = drives[0]
-	if len(drives) == 1:
-		bprint(f"{Fore.GREEN}Found matching drive!{Style.RESET_ALL} Path = {Fore.YELLOW}{drv}{Style.RESET_ALL}.", silence=silence_output)
-	else:
-		bprint(f"{Fore.RED}Found multiple matching drives!{Style.RESET_ALL} Returning first matched drive. Path = {Fore.YELLOW}{drv}{Style.RESET_ALL}.", silence=silence_output)
+	bprint(f"{Fore.GREEN}Found matching drive!{Style.RESET_ALL} Path = {Fore.YELLOW}{drv}{Style.RESET_ALL}.", silence=silence_output)
 	return drv
 
-def dict_to_hdf(root_data:dict, save_file:str, use_json_backup:bool=False, show_detail:bool=False) -> bool:
+locate_drive.clear_cache = _clear_locate_drive_cache
+
+# Arrays larger than this are written chunked and compressed
+_COMPRESS_MIN_BYTES = 64*1024
+
+def _compression_kwargs(compression) -> dict:
+	''' Returns the create_dataset keyword arguments for the requested
+	compression. Use None to disable compression, 'blosc' for Blosc/zstd
+	(requires hdf5plugin), or any filter name accepted by h5py (ex. 'lzf',
+	'gzip').
+	'''
+	
+	if compression is None:
+		return {}
+	
+	if compression == "blosc":
+		import hdf5plugin
+		return dict(hdf5plugin.Blosc(cname="zstd", clevel=3, shuffle=hdf5plugin.Blosc.SHUFFLE))
+	
+	return {"compression": compression, "shuffle": True}
+
+# Chunk cache settings for chunked datasets written with a chunk size estimate.
+# The slot table is allocated for every chunked dataset opened, so its size is
+# derived from the number of chunks the cache holds and capped.
+_RDCC_MIN_BYTES = 64*1024*1024
+_RDCC_SLOTS_PER_CHUNK = 100
+_RDCC_MIN_NSLOTS = 521 # HDF5 default
+_RDCC_MAX_NSLOTS = 12007
+_RDCC_W0 = 0.75
+
+# Upper limit of h5py's automatic chunk size
+_AUTO_CHUNK_MAX = 1024*1024
+
+def _chunk_cache_kwargs(est_max_chunk:int) -> dict:
+	''' Returns h5py chunk cache keyword arguments (accepted by h5py.File and
+	create_dataset) sized to hold several of the largest chunks expected,
+	instead of h5py's 1 MiB default. Returns no arguments, leaving the HDF5
+	defaults, if `est_max_chunk` is not positive.
+	'''
+	
+	if est_max_chunk <= 0:
+		return {}
+	
+	rdcc_nbytes = max(_RDCC_MIN_BYTES, est_max_chunk*10)
+	nslots = _RDCC_SLOTS_PER_CHUNK * (rdcc_nbytes // est_max_chunk)
+	nslots = min(max(nslots, _RDCC_MIN_NSLOTS), _RDCC_MAX_NSLOTS)
+	return {"rdcc_nbytes": rdcc_nbytes, "rdcc_nslots": nslots, "rdcc_w0": _RDCC_W0}
+
+def _open_hdf(path:str, mode:str, est_max_chunk:int=0) -> h5py.File:
+	''' Opens an HDF file, with a chunk cache sized for `est_max_chunk` if
+	provided (see _chunk_cache_kwargs).
+	
+	Args:
+		path (str): File to open.
+		mode (str): File mode passed to h5py.File.
+		est_max_chunk (int): Estimated size in bytes of the largest chunk.
+	
+	Returns:
+		h5py.File: Opened file.
+	'''
+	
+	return h5py.File(path, mode, **_chunk_cache_kwargs(est_max_chunk))
+
+# gzip arrays larger than this are compressed in parallel and written with
+# HDF5 direct chunk write
+_DIRECT_CHUNK_MIN_BYTES = 16*1024*1024
+_DIRECT_CHUNK_GZIP_LEVEL = 4 # Same as h5py's default gzip level
+
+def _write_direct_chunks(fh:h5py.File, path:str, arr:np.ndarray) -> h5py.Dataset:
+	''' Writes a numeric array as a shuffled, gzip-compressed dataset, bypassing
+	the HDF5 filter pipeline. Each chunk is shuffled and compressed with zlib
+	(which releases the GIL) in a thread pool, then stored with
+	write_direct_chunk. The result reads back like any gzip+shuffle dataset.
+	'''
+	
+	dset = fh.create_dataset(path, shape=arr.shape, dtype=arr.dtype, chunks=True, compression="gzip", compression_opts=_DIRECT_CHUNK_GZIP_LEVEL, shuffle=True)
+	chunks = dset.chunks
+	itemsize = arr.dtype.itemsize
+	
+	def compress_chunk(offset:tuple):
+		tile = arr[tuple(slice(o, o+c) for o, c in zip(offset, chunks))]
+		
+		# Edge chunks are always stored at full chunk size
+		if tile.shape != chunks:
+			full = np.zeros(chunks, dtype=arr.dtype)
+			full[tuple(slice(0, n) for n in tile.shape)] = tile
+			tile = full
+		
+		# Apply the HDF5 shuffle filter (group bytes by significance), then deflate
+		raw = np.ascontiguousarray(tile).view(np.uint8).reshape(-1, itemsize).T.tobytes()
+		return offset, zlib.compress(raw, _DIRECT_CHUNK_GZIP_LEVEL)
+	
+	offsets = itertools.product(*(range(0, n, c) for n, c in zip(arr.shape, chunks)))
+	with ThreadPoolExecutor() as pool:
+		for offset, buf in pool.map(compress_chunk, offsets):
+			dset.id.write_direct_chunk(offset, buf)
+	
+	return dset
+
+def dict_to_hdf(root_data:dict, save_file:str, use_json_backup:bool=False, show_detail:bool=False, compression:str=None) -> bool:
 	''' Writes a dictionary to an HDF file per the rules used by 'write_level()'. 
 	
 	* If the value of a key in another dictionary, the key is made a group (directory).
@@ -98,49 +250,71 @@ def dict_to_hdf(root_data:dict, save_file:str, use_json_backup:bool=False, show_
 		save_file (str): Filename to write to.
 		use_json_backup (bool): Optional parameter to save a copy of the file as a JSON dict. Default = False.
 		show_detail (bool): Optional parameter to show detail while saving. Default = False.
+		compression (str): Optional compression used for numeric arrays larger than 64 KiB.
+			Accepts any h5py filter name, 'blosc' (requires hdf5plugin) or None. Note that
+			files using 'lzf' or 'blosc' need a plugin to be read outside of h5py. With
+			'gzip', arrays over 16 MiB are compressed in parallel threads. Default = None.
 	
 	Returns:
 		bool: True if successfully saved.
 	'''
+	
+	compress_kwargs = _compression_kwargs(compression)
 		
-	def write_level(fh:h5py.File, level_data:dict, show_detail:bool=False):
+	def write_level(fh:h5py.File, root_data:dict, show_detail:bool=False):
 		''' Writes a dictionary to the hdf file.
 		
-		Recursive function used by  '''
+		Nested dictionaries are walked breadth-first with an explicit queue, and
+		every group and dataset is created by its full path from the file root.
+		'''
 		
 		if show_detail:
-				print(f"write_level received item of type: {type(level_data)}")
+				print(f"write_level received item of type: {type(root_data)}")
 		
-		# Scan over each directory of root-data
-		for k, v in level_data.items():
-			
-			if show_detail:
-				print(f"Handling object key={k} of type {type(v)}")
+		queue = deque([("", root_data)])
+		while queue:
+			prefix, level_data = queue.popleft()
 			
-			# If value is a dictionary, this key represents a directory
-			if type(v) == dict:
+			# Scan over each directory of this level
+			for k, v in level_data.items():
+				path = f"{prefix}{k}"
 				
 				if show_detail:
-					print(f"\tDetected dictionary. Creating group {k} and writing new level...")
+					print(f"Handling object key={path} of type {type(v)}")
 				
-				# Create a new group
-				fh.create_group(k)
-				
-				# Write the dictionary to the group
-				write_level(fh[k], v, show_detail=show_detail)
+				# If value is a dictionary, this key represents a directory
+				if type(v) == dict:
 					
-			else: # Otherwise try to write this datatype (ex. list of floats)
-				
-				if show_detail:
-					print(f"\tDetected non-dictionary. Creating dataset {k} and saving value {v}")
-				
-				# Write value as a dataset
-				try:
-					fh.create_dataset(k, data=v)
-				except Exception as e:
 					if show_detail:
-						print(f"Failed to write dataset '{k}' with value of type {type(v)}. ({e})")
-					return False
+						print(f"\tDetected dictionary. Creating group {path} and queueing new level...")
+					
+					# Create a new group, and queue the dictionary to write into it
+					fh.create_group(path)
+					queue.append((f"{path}/", v))
+						
+				else: # Otherwise try to write this datatype (ex. list of floats)
+					
+					if show_detail:
+						print(f"\tDetected non-dictionary. Creating dataset {path} and saving value {v}")
+					
+					# Write value as a dataset. Numeric lists/arrays are converted once
+					# and large ones are stored chunked and compressed.
+					try:
+						arr = np.asarray(v) if isinstance(v, (list, tuple, np.ndarray)) else None
+						if arr is not None and arr.dtype.kind in "biufc":
+							if compression == "gzip" and arr.nbytes > _DIRECT_CHUNK_MIN_BYTES:
+								_write_direct_chunks(fh, path, arr)
+							elif compress_kwargs and arr.nbytes > _COMPRESS_MIN_BYTES:
+								cache_kwargs = _chunk_cache_kwargs(min(arr.nbytes, _AUTO_CHUNK_MAX))
+								fh.create_dataset(path, data=arr, chunks=True, **compress_kwargs, **cache_kwargs)
+							else:
+								fh.create_dataset(path, data=arr)
+						else:
+							fh.create_dataset(path, data=v)
+					except Exception as e:
+						if show_detail:
+							print(f"Failed to write dataset '{path}' with value of type {type(v)}. ({e})")
+						return False
 		return True
 	
 	# Start timer
@@ -150,8 +324,8 @@ def dict_to_hdf(root_data:dict, save_file:str, use_json_backup:bool=False, show_
 	hdf_successful = True
 	exception_str = ""
 	
-	# Recursively write HDF file
-	with h5py.File(save_file, 'w') as fh:
+	# Write HDF file
+	with _open_hdf(save_file, 'w') as fh:
 		
 		# Try to write dictionary
 		try:
@@ -186,44 +360,60 @@ def dict_to_hdf(root_data:dict, save_file:str, use_json_backup:bool=False, show_
 		
 		return True
 
+# Numeric datasets with more elements than this are read into a preallocated
+# array with read_direct
+_READ_DIRECT_MIN_SIZE = 4096
+
 def hdf_to_dict(filename, to_lists:bool=True, decode_strs:bool=True) -> dict:
 	''' Reads a HDF file and converts the data to a dictionary '''
 	
+	def read_dataset(dset:h5py.Dataset):
+		
+		# Let h5py decode string datasets in one call
+		if decode_strs and h5py.check_string_dtype(dset.dtype) is not None:
+			val = dset.asstr()[()]
+			if type(val) == np.ndarray and to_lists:
+				val = val.tolist()
+			return val
+		
+		# Read large numeric datasets straight into a preallocated array. Scalars
+		# and strings go through the normal read.
+		if dset.shape and dset.size > _READ_DIRECT_MIN_SIZE and dset.dtype.kind in "biufc":
+			val = np.empty(dset.shape, dtype=dset.dtype)
+			dset.read_direct(val)
+		else:
+			val = dset[()]
+		
+		# Converting to a pandas DataFrame will crash with
+		# some numpy arrays, so convert to a list.
+		if type(val) == np.ndarray and to_lists:
+				val = val.tolist()
+		elif type(val) == list and not to_lists:
+				val = np.asarray(val)
+		return val
+	
 	def read_level(fh:h5py.File) -> dict:
 		
-		# Initialize output dict
+		# Walk links (not objects) with an explicit stack, so soft links and
+		# repeated hard links are read like any other key. Each entry keeps the
+		# groups above it, to catch links back to a parent group.
 		out_data = {}
-		
-		# Scan over each element on this level
-		for k in fh.keys():
-			
-			# Read value
-			if type(fh[k]) == h5py._hl.group.Group: # If group, recusively call
-				out_data[k] = read_level(fh[k])
-			else: # Else, read value from file
-				out_data[k] = fh[k][()]
-				
-				# Converting to a pandas DataFrame will crash with
-				# some numpy arrays, so convert to a list.
-				is_list_type = False
-				if type(out_data[k]) == np.ndarray and to_lists:
-						out_data[k] = list(out_data[k])
-						is_list_type = True
-				elif type(out_data[k]) == list and not to_lists:
-						out_data[k] = np.array(out_data[k])
-						is_list_type = True
-				
-				if is_list_type and len(out_data[k]) > 0 and type(out_data[k][0]) == bytes:
-					for idx, val in enumerate(out_data[k]):
-						out_data[k][idx] = val.decode()
+		stack = [(fh, out_data, (fh.id,))]
+		while stack:
+			group, level_data, parents = stack.pop()
+			for k, obj in group.items():
+				if isinstance(obj, h5py.Group):
+					if obj.id in parents:
+						raise ValueError(f"Group '{obj.name}' links back to one of its parents")
+					level_data[k] = {}
+					stack.append((obj, level_data[k], parents + (obj.id,)))
 				else:
-					if decode_strs and type(out_data[k]) == bytes:
-						out_data[k] = out_data[k].decode()
-				
+					level_data[k] = read_dataset(obj)
+		
 		return out_data
 	
 	# Open file
-	with h5py.File(filename, 'r') as fh:
+	with _open_hdf(filename, 'r') as fh:
 		
 		try:
 			root_data = read_level(fh)
@@ -234,36 +424,39 @@ def hdf_to_dict(filename, to_lists:bool=True, decode_strs:bool=True) -> dict:
 	# Return result
 	return root_data
 
+@lru_cache(maxsize=128)
+def _summary_indent(indent_level:int, indent_char:str) -> str:
+	''' Returns the colored indent string used by dict_summary for a given
+	nesting level. Levels alternate between '|' and '.' markers. '''
+	
+	indent_char0 = f" {indent_char}"
+	indent_char1 = f"|{indent_char}"
+	indent_char2 = f".{indent_char}"
+	
+	indent_str = ""
+	for i in range(indent_level):
+		if i == 0:
+			indent_str += indent_char0
+		elif i % 2 == 1:
+			indent_str += indent_char1
+		else:
+			indent_str += indent_char2
+	return f"{Fore.LIGHTBLACK_EX}{indent_str}{Style.RESET_ALL}"
+
 def dict_summary(x:dict, verbose:int=0, indent_level:int=0, indent_char:str="   "):
 	'''
 	'''
 	
 	color_dict = Fore.CYAN
 	color_name = Fore.GREEN
-	color_lines = Fore.LIGHTBLACK_EX
 	color_list_type = Fore.MAGENTA
 	color_type = Fore.YELLOW
 	color_value = Fore.WHITE
 	color_ellips = Fore.RED
-	
-	lvlmarker_1 = "|"
-	lvlmarker_2 = "."
+	reset = Style.RESET_ALL
 	
 	def get_indent(indent_level:int):
-		
-		indent_char0 = f" {indent_char}"
-		indent_char1 = f"{lvlmarker_1}{indent_char}"
-		indent_char2 = f"{lvlmarker_2}{indent_char}"
-		
-		indent_str = ""
-		for i in range(indent_level):
-			if i == 0:
-				indent_str += indent_char0
-			elif i % 2 == 1:
-				indent_str += indent_char1
-			else:
-				indent_str += indent_char2
-		return f"{color_lines}{indent_str}{Style.RESET_ALL}"
+		return _summary_indent(indent_level, indent_char)
 	
 	def value_to_string(val, verbose:int, indent_level, length_limit:int=50, wrap_length:int=80):
 		
@@ -281,31 +474,18 @@ def dict_summary(x:dict, verbose:int=0, indent_level:int=0, indent_char:str="
 		# If verbose == 2, indent and print full value
 		if verbose == 2:
 			
-			# Get length of color specifier
-			cvlen = len(color_value)
-			
 			# Get indent char
 			indent = get_indent(indent_level+1)
-			indent.replace('\t', "    ")
 			
-			# Initialize with newline, indent and color
+			# Wrap the raw text to fit beside the (uncolored) indent, then re-apply
+			# the indent and color to each line. Line breaks in the value are kept.
 			if type(val) == str:
-				val_str = f"\n{indent}{color_value}\"{val_str}\""
-			else:
-				val_str = f"\n{indent}{color_value}{val_str}"
-			val_str.replace('\t', "    ")
-			
-			# Find last newline
-			nlidx = val_str.rfind('\n')
-			
-			# Continue to wrap line until under length limit
-			while len(val_str) - nlidx - cvlen > wrap_length:
-				
-				# Add newline (and color specs)
-				val_str = val_str[:(nlidx)+wrap_length+cvlen] + "\n" + indent + color_value + val_str[(nlidx)+wrap_length+cvlen:]
-				
-				# Find new index
-				nlidx = val_str.rfind('\n')
+				val_str = f"\"{val_str}\""
+			width = max(wrap_length - (indent_level+1)*(len(indent_char)+1), 1)
+			lines = []
+			for raw_line in val_str.splitlines() or [""]:
+				lines += textwrap.wrap(raw_line, width=width, drop_whitespace=False, break_long_words=True) or [""]
+			val_str = "".join(f"\n{indent}{color_value}{line}" for line in lines)
 		
 		else:
 			# Add color to string
@@ -316,17 +496,21 @@ def dict_summary(x:dict, verbose:int=0, indent_level:int=0, indent_char:str="
 		
 		return val_str
 	
+	# Indent is the same for every key on this level
+	indent = get_indent(indent_level)
+	
 	# Scan over each key
-	for k in x.keys():
+	for k, val in x.items():
 		
 		# IF key points to dictionary, recursive call
-		if type(x[k]) == dict:
-			print(f"{get_indent(indent_level)}[{color_dict}{k}{Style.RESET_ALL}]")
-			dict_summary(x[k], verbose=verbose, indent_level=indent_level+1)
+		if type(val) == dict:
+			print(f"{indent}[{color_dict}{k}{reset}]")
+			dict_summary(val, verbose=verbose, indent_level=indent_level+1, indent_char=indent_char)
 			
 		# Otherwise print data element stats
 		else:
-			val = x[k]
+			val_str = value_to_string(val, verbose, indent_level)
+			key_str = f"{indent}{color_name}{k}{reset}"
 			
 			if type(val) == list:
 				try:
@@ -334,16 +518,39 @@ def dict_summary(x:dict, verbose:int=0, indent_level:int=0, indent_char:str="
 				except:
 					val0 = None
 				
-				if type(val0) == list:
-					val_str = value_to_string(val, verbose, indent_level)
-					print(f"{get_indent(indent_level)}{color_name}{k}{Style.RESET_ALL} = {color_list_type}{type(val)}{Style.RESET_ALL}, {len(val)} x {color_list_type}{type(val0)} {val_str}{Style.RESET_ALL}")
-				else:
-					val_str = value_to_string(val, verbose, indent_level)
-					print(f"{get_indent(indent_level)}{color_name}{k}{Style.RESET_ALL} = {color_list_type}{type(val)}{Style.RESET_ALL}, {len(val)} x {color_type}{type(val0)} {val_str}{Style.RESET_ALL}")
+				color_elem = color_list_type if type(val0) == list else color_type
+				print(f"{key_str} = {color_list_type}{type(val)}{reset}, {len(val)} x {color_elem}{type(val0)} {val_str}{reset}")
 			else:
-				val_str = value_to_string(val, verbose, indent_level)
-				print(f"{get_indent(indent_level)}{color_name}{k}{Style.RESET_ALL} = {color_type}{type(val)}{Style.RESET_ALL} {val_str}{Style.RESET_ALL}")
+				print(f"{key_str} = {color_type}{type(val)}{reset} {val_str}{reset}")
 
+# Argon2id cost parameters used for new files (time cost, memory in KiB, lanes)
+_ARGON2_PARAMS = {"time_cost": 3, "memory_cost": 64*1024, "parallelism": 4}
+
+# Accepted range of each Argon2id parameter read back from a file, so a corrupt
+# or crafted file can't request an unbounded amount of work or memory
+_ARGON2_LIMITS = {"time_cost": (1, 64), "memory_cost": (8, 1024*1024), "parallelism": (1, 64)}
+
+def _check_argon2_params(params) -> dict:
+	''' Validates the Argon2id parameters stored in a dumpsecure file, and
+	returns them. Raises ValueError if any are missing, unknown or out of range.
+	'''
+	
+	if type(params) != dict or set(params) != set(_ARGON2_LIMITS):
+		raise ValueError(f"Invalid Argon2id parameters in file ({params!r})")
+	
+	for name, (low, high) in _ARGON2_LIMITS.items():
+		val = params[name]
+		if type(val) != int or not low <= val <= high:
+			raise ValueError(f"Argon2id parameter '{name}' = {val!r} is outside of accepted range {low} to {high}")
+	
+	# Argon2 needs at least 8 KiB of memory per lane
+	if params["memory_cost"] < 8*params["parallelism"]:
+		raise ValueError("Argon2id memory_cost must be at least 8 x parallelism")
+	
+	return params
+
+# Derived keys are cached so the same password/salt pair is only stretched once
+@lru_cache(maxsize=32)
 def _derive_key(password:str, salt:bytes, iterations:int = 200_000) -> bytes:
 	kdf = PBKDF2HMAC(
 		algorithm=hashes.SHA256(),
@@ -353,16 +560,32 @@ def _derive_key(password:str, salt:bytes, iterations:int = 200_000) -> bytes:
 	)
 	return base64.urlsafe_b64encode(kdf.derive(password.encode()))
 
+@lru_cache(maxsize=32)
+def _derive_key_argon2(password:str, salt:bytes, time_cost:int, memory_cost:int, parallelism:int) -> bytes:
+	from argon2.low_level import hash_secret_raw, Type
+	raw = hash_secret_raw(password.encode(), salt, time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism, hash_len=32, type=Type.ID)
+	return base64.urlsafe_b64encode(raw)
+
 
-def dumpsecure(file_pointer, encrypted:dict, password:str, plain:dict={}, indent:int=4):
+def dumpsecure(file_pointer, encrypted:dict, password:str, plain:dict={}, indent:int=4, kdf:str="pbkdf2"):
 	"""
 	Write a JSON file containing:
 	  - 'plain': unencrypted dictionary
 	  - 'encrypted': password-protected dictionary
+	
+	The key is derived from the password with PBKDF2-HMAC-SHA256 by default. Set
+	kdf to 'argon2id' to use Argon2id instead (requires argon2-cffi).
 	"""
 	
 	salt = os.urandom(16)
-	key = _derive_key(password, salt)
+	kdf_info = {"kdf": kdf}
+	if kdf == "argon2id":
+		key = _derive_key_argon2(password, salt, **_ARGON2_PARAMS)
+		kdf_info["kdf_params"] = dict(_ARGON2_PARAMS)
+	elif kdf == "pbkdf2":
+		key = _derive_key(password, salt)
+	else:
+		raise ValueError(f"Unknown key derivation function '{kdf}'")
 	fernet = Fernet(key)
 	
 	encrypted_bytes = json.dumps(encrypted).encode()
@@ -373,10 +596,12 @@ def dumpsecure(file_pointer, encrypted:dict, password:str, plain:dict={}, indent
 		"encrypted": {
 			"salt": base64.b64encode(salt).decode(),
 			"ciphertext": ciphertext.decode(),
+			**kdf_info,
 		},
 	}
 	
-	json.dump(out, file_pointer, indent=indent)
+	# Encode in one go and write once, rather than json.dump's chunked writes
+	file_pointer.write(json.dumps(out, indent=indent))
 
 def loadsecure(file_pointer, password:str) -> tuple[Dict[str, Any], Dict[str, Any]]:
 	"""
@@ -397,7 +622,14 @@ def loadsecure(file_pointer, password:str) -> tuple[Dict[str, Any], Dict[str, An
 	salt = base64.b64decode(enc["salt"])
 	ciphertext = enc["ciphertext"].encode()
 	
-	key = _derive_key(password, salt)
+	# Files without a 'kdf' entry were written with PBKDF2
+	kdf = enc.get("kdf", "pbkdf2")
+	if kdf == "argon2id":
+		key = _derive_key_argon2(password, salt, **_check_argon2_params(enc.get("kdf_params")))
+	elif kdf == "pbkdf2":
+		key = _derive_key(password, salt)
+	else:
+		raise ValueError(f"Unknown key derivation function '{kdf}'")
 	fernet = Fernet(key)
 	
 	try:
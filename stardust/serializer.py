@@ -2,14 +2,27 @@ import datetime
 from typing import Any, Type, Optional, Any, Sequence, Callable, Dict
 from datetime import datetime, timezone
 from dataclasses import dataclass
+from functools import partial, lru_cache
 import json
+import math
+import copy
+import base64
 import numpy as np
 from abc import ABC, abstractmethod
 from colorama import Fore, Style
 
 import pylogfile.base as plf
 
-SERIALIZER_FORMAT_VERSION = 1  # bump when your Serializer file shape/semantics change
+try:
+	import orjson
+except ImportError:
+	orjson = None
+
+SERIALIZER_FORMAT_VERSION = 2  # bump when your Serializer file shape/semantics change
+
+# Format versions from_serial_dict can read. Version 2 stores arrays as base64
+# buffers and tags non-finite floats and ints beyond 64 bits.
+_READABLE_FORMAT_VERSIONS = (1, 2)
 
 @dataclass
 class ClassRegistryInfo:
@@ -30,6 +43,19 @@ class ClassRegistryInfo:
 # A registry so only known classes can be reconstructed
 SERIALIZABLE_CLASS_REGISTRY: dict[str, ClassRegistryInfo] = {}
 
+# Same registry keyed by class object, used for lookups when serializing
+_REGISTRY_BY_TYPE: dict[type, ClassRegistryInfo] = {}
+
+def _json_default(obj:Any) -> Any:
+	""" Fallback for values the JSON encoder cannot write natively (ex. numpy
+	arrays orjson does not support, or any numpy data with the stdlib encoder).
+	"""
+	if isinstance(obj, np.ndarray):
+		return obj.tolist()
+	if isinstance(obj, np.generic):
+		return obj.item()
+	raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
 def to_serial_dict(obj:Any) -> dict:
 	""" Converts an object to a state specifying serialized dictionary.
 	
@@ -51,7 +77,17 @@ def from_serial_dict(serial_data:dict) -> Any:
 	
 	Returns:
 		New object
+	
+	Raises:
+		ValueError: If the data was written in a serializer format version this
+			version of stardust cannot read.
 	"""
+	
+	# Refuse files written in a newer format rather than misread them
+	version = serial_data.get("__serializer_format__", {}).get("version", 1)
+	if version not in _READABLE_FORMAT_VERSIONS:
+		raise ValueError(f"Unsupported serializer format version {version} (this version of stardust reads versions {', '.join(str(v) for v in _READABLE_FORMAT_VERSIONS)}).")
+	
 	return Serializable.deserialize(serial_data['state'])
 
 def restore_state(filename:str):
@@ -60,8 +96,21 @@ def restore_state(filename:str):
 	
 	#TODO: Make it support HDF and JSON, with flags and autodetect
 	# Load JSON file
-	with open(filename, "r", encoding="utf-8") as f:
-		json_data = json.load(f)
+	with open(filename, "rb") as f:
+		raw = f.read()
+	if orjson is None:
+		json_data = json.loads(raw)
+	else:
+		try:
+			json_data = orjson.loads(raw)
+		except ValueError:
+			# Files from older versions may contain NaN/Infinity tokens
+			json_data = json.loads(raw)
+		else:
+			# Version 1 files don't tag ints beyond 64 bits, which orjson would
+			# read as floats
+			if type(json_data) == dict and json_data.get("__serializer_format__", {}).get("version", 1) == 1:
+				json_data = json.loads(raw)
 	
 	# Turn into an object
 	return from_serial_dict(json_data)
@@ -82,8 +131,21 @@ def dump_state(obj, filename:str) -> None:
 	
 	#TODO: Make it support HDF and JSON, with flags and autodetect
 	# Save to file
+	if orjson is not None:
+		# Encode before opening the file, so a failure leaves no partial file.
+		# orjson rejects some valid data (ex. ints beyond 64 bits), which is
+		# left to the stdlib encoder below.
+		try:
+			raw = orjson.dumps(serial_dict, default=_json_default, option=orjson.OPT_SERIALIZE_NUMPY|orjson.OPT_NON_STR_KEYS|orjson.OPT_INDENT_2)
+		except orjson.JSONEncodeError:
+			raw = None
+		if raw is not None:
+			with open(filename, "wb") as f:
+				f.write(raw)
+			return
+	
 	with open(filename, "w", encoding="utf-8") as f:
-		json.dump(serial_dict, f, ensure_ascii=False, indent=2)
+		json.dump(serial_dict, f, ensure_ascii=False, indent=2, default=_json_default)
 
 def valid_serialized_object(d:dict):
 	''' Checks if a dictionary contains the proper keys to comply as a valid
@@ -97,6 +159,172 @@ def valid_serialized_object(d:dict):
 	# Return if all expected keys are present
 	return all( x in d.keys() for x in expected)
 
+def _encode_datetime(dt: datetime) -> dict:
+	# Normalize to ISO 8601. Preserve tz if present; mark naivety explicitly.
+	if dt.tzinfo is None:
+		iso = dt.isoformat(timespec="microseconds")
+		return {"__type__": "__datetime__", "data": iso, "naive": True}
+	else:
+		# Use RFC3339-style 'Z' when UTC to keep it compact.
+		aware = dt.astimezone(timezone.utc)
+		iso = aware.replace(tzinfo=timezone.utc).isoformat(timespec="microseconds").replace("+00:00", "Z")
+		return {"__type__": "__datetime__", "data": iso, "naive": False}
+
+def _encode_ndarray(arr) -> dict:
+	# Object arrays can't be stored as a raw buffer, keep them as nested lists.
+	if arr.dtype.hasobject:
+		return {
+			"__type__": "__ndarray__",
+			"shape": list(arr.shape),
+			"dtype": str(arr.dtype),
+			"data": arr.tolist(),
+		}
+	
+	# Store the raw buffer as base64. dtype.str includes the byte order, and
+	# structured dtypes are stored as a descr list to keep their fields.
+	if arr.dtype.fields is None:
+		dtype = arr.dtype.str
+	else:
+		dtype = np.lib.format.dtype_to_descr(arr.dtype)
+	return {
+		"__type__": "__ndarray__",
+		"shape": list(arr.shape),
+		"dtype": dtype,
+		"b64": base64.b64encode(np.ascontiguousarray(arr).tobytes()).decode("ascii"),
+	}
+
+def _encode_float(x: float) -> Any:
+	# JSON has no NaN/Infinity (orjson writes null), so tag non-finite floats.
+	if math.isfinite(x):
+		return x
+	return {"__type__": "__float__", "data": repr(float(x))}
+
+# Range of ints orjson reads back exactly
+_INT_MIN = -2**63
+_INT_MAX = 2**64 - 1
+
+def _encode_int(x: int) -> Any:
+	# orjson reads ints outside of 64 bits as floats, so tag them.
+	if _INT_MIN <= x <= _INT_MAX:
+		return x
+	return {"__type__": "__int__", "data": str(int(x))}
+
+def _expand_dict(obj: dict):
+	# Pre-fill keys so the output keeps the input's key order
+	out = dict.fromkeys(obj)
+	return out, out, list(obj.items())
+
+def _expand_list(obj):
+	out = [None] * len(obj)
+	return out, out, list(enumerate(obj))
+
+def _expand_set(obj: set):
+	data = [None] * len(obj)
+	return {"__type__": "__set__", "data": data}, data, list(enumerate(obj))
+
+# Encoders for exact leaf types, looked up by type(obj) in Serializable.serialize
+_ENCODERS = {
+	int: _encode_int,
+	float: _encode_float,
+	datetime: _encode_datetime,
+	np.ndarray: _encode_ndarray,
+}
+
+# Expanders for exact container types. Each returns (output, target, children)
+# where the serialized children are written into target[key].
+_EXPANDERS = {
+	dict: _expand_dict,
+	list: _expand_list,
+	tuple: _expand_list,
+	set: _expand_set,
+}
+
+def _decode_datetime(obj: dict) -> datetime:
+	s = obj["data"]
+	# Accept either ...Z or ...+HH:MM
+	if s.endswith("Z"):
+		s = s.replace("Z", "+00:00")
+	dt = datetime.fromisoformat(s)
+	# If it was marked naive originally, drop tzinfo
+	if obj.get("naive"):
+		return dt.replace(tzinfo=None)
+	return dt
+
+def _descr_from_json(descr):
+	''' Rebuilds a numpy dtype descr read back from JSON, where its tuples
+	have become lists. '''
+	
+	if isinstance(descr, str):
+		return descr
+	
+	fields = []
+	for field in descr:
+		name = tuple(field[0]) if isinstance(field[0], list) else field[0] # (title, name)
+		shape = (tuple(field[2]),) if len(field) > 2 else ()
+		fields.append((name, _descr_from_json(field[1])) + shape)
+	return fields
+
+def _decode_ndarray(obj: dict):
+	if "b64" in obj:
+		buf = bytearray(base64.b64decode(obj["b64"])) # writable copy
+		dtype = obj["dtype"]
+		if not isinstance(dtype, str):
+			dtype = np.lib.format.descr_to_dtype(_descr_from_json(dtype))
+		return np.frombuffer(buf, dtype=dtype).reshape(tuple(obj["shape"]))
+	
+	# Older files store data as nested lists
+	if np is None:
+		# Fall back to plain nested lists if numpy isn't available at load time
+		return obj["data"]
+	arr = np.array(obj["data"], dtype=obj["dtype"])
+	return arr.reshape(tuple(obj["shape"]))
+
+def _decode_float(obj: dict) -> float:
+	return float(obj["data"])
+
+def _decode_int(obj: dict) -> int:
+	return int(obj["data"])
+
+# Decoders for leaf "__type__" tags, used by Serializable.deserialize
+_DECODERS = {
+	"__datetime__": _decode_datetime,
+	"__ndarray__": _decode_ndarray,
+	"__float__": _decode_float,
+	"__int__": _decode_int,
+}
+
+def _restore_registered(info: ClassRegistryInfo, from_version: int, holder: list):
+	# Called once the inner payload in holder[0] has been fully decoded
+	payload = holder[0]
+	to_version = info.version
+	if from_version != to_version:
+		if info.upgrade:
+			payload = info.upgrade(payload, from_version, to_version)
+	return info.from_(payload)
+
+def _restore_set(data: list) -> set:
+	return set(data)
+
+# Marks the stack frame where a walker is done with a container's children
+_EXIT = object()
+
+@lru_cache(maxsize=None)
+def _fast_restore_blockers(cls: Type) -> frozenset|None:
+	''' Returns the names of data descriptors (ex. properties) defined on `cls`,
+	which must still go through setattr. Returns None if the class can't be
+	restored by updating its __dict__ at all.
+	'''
+	
+	if not getattr(cls, "__fast_restore__", True):
+		return None
+	if hasattr(cls, "__slots__") or cls.__setattr__ is not object.__setattr__:
+		return None
+	
+	return frozenset(
+		name for klass in cls.__mro__ for name, attr in vars(klass).items()
+		if hasattr(type(attr), "__set__") or hasattr(type(attr), "__delete__")
+	)
+
 class Serializable:
 	''' Class that allows the class data to be serialized to a dictionary format
 	for storage or transfer. Works by requiring any class data that needs to be
@@ -116,6 +344,7 @@ class Serializable:
 	__state_fields__:Sequence[str] = ()
 	__schema_version__:int = 1
 	__auto_register__:bool = True  # opt-out switch for ABCs etc.
+	__fast_restore__:bool = True  # restore state with __dict__.update() when safe
 
 	def get_state_dict(self) -> dict[str, Any]:
 		''' Creates a dictionary with all registered state fields. The data in this
@@ -140,9 +369,14 @@ class Serializable:
 		# Create a  new instance of the class
 		obj = cls.__new__(cls)  # no __init__ call
 		
-		# Scan over all data items and populate class parameters
-		for k, v in data.items():
-			setattr(obj, k, v)
+		# Populate class parameters in one go, unless the class has slots, a
+		# custom __setattr__ or a property for one of the fields.
+		blockers = _fast_restore_blockers(cls)
+		if blockers is not None and blockers.isdisjoint(data):
+			obj.__dict__.update(data)
+		else:
+			for k, v in data.items():
+				setattr(obj, k, v)
 		
 		# If __post_deserialzie__ is populated for this class type, call it.
 		post = getattr(obj, "__post_deserialize__", None)
@@ -182,9 +416,11 @@ class Serializable:
 		if prev and prev.cls is cls and prev.version == version and prev.to == to and prev.from_ == from_ and prev.upgrade == upgrade:
 			return cls
 
-		SERIALIZABLE_CLASS_REGISTRY[cls.__name__] = ClassRegistryInfo(
+		info = ClassRegistryInfo(
 			cls=cls, to=to, from_=from_, version=version, upgrade=upgrade
 		)
+		SERIALIZABLE_CLASS_REGISTRY[cls.__name__] = info
+		_REGISTRY_BY_TYPE[cls] = info
 		return cls
 	
 	def __init_subclass__(cls, **kwargs):
@@ -213,114 +449,176 @@ class Serializable:
 	@staticmethod
 	def serialize(obj: Any) -> Any:
 		
-		def _encode_datetime(dt: datetime) -> dict:
-			# Normalize to ISO 8601. Preserve tz if present; mark naivety explicitly.
-			if dt.tzinfo is None:
-				iso = dt.isoformat(timespec="microseconds")
-				return {"__type__": "__datetime__", "data": iso, "naive": True}
-			else:
-				# Use RFC3339-style 'Z' when UTC to keep it compact.
-				aware = dt.astimezone(timezone.utc)
-				iso = aware.replace(tzinfo=timezone.utc).isoformat(timespec="microseconds").replace("+00:00", "Z")
-				return {"__type__": "__datetime__", "data": iso, "naive": False}
-
-		def _encode_ndarray(arr) -> dict:
-			# JSON-friendly: store shape/dtype/data (as nested lists).
-			return {
-				"__type__": "__ndarray__",
-				"shape": list(arr.shape),
-				"dtype": str(arr.dtype),
-				"data": arr.tolist(),
-			}
-		
-		def _is_numpy_scalar(o: Any) -> bool:
-			return np is not None and isinstance(o, np.generic)
-		
-		def _is_numpy_array(o: Any) -> bool:
-			return np is not None and isinstance(o, np.ndarray)
-		
-		# Registered custom classes
-		info = SERIALIZABLE_CLASS_REGISTRY.get(type(obj).__name__)
-		if info:
-			payload = info.to(obj)
-			return {
-				"__type__": type(obj).__name__,
-				"cls_serializer_version": info.version,     # per-class schema version
-				"state_data": Serializable.serialize(payload),
-			}
-		
-		# datetime
-		if isinstance(obj, datetime):
-			return _encode_datetime(obj)
-		
-		# numpy
-		if _is_numpy_scalar(obj):
-			return obj.item()
-		if _is_numpy_array(obj):
-			return _encode_ndarray(obj)
-		
-		# Containers
-		if isinstance(obj, dict):
-			return {k: Serializable.serialize(v) for k, v in obj.items()}
-		if isinstance(obj, (list, tuple)):
-			return [Serializable.serialize(v) for v in obj]
-		if isinstance(obj, set):
-			return {"__type__": "__set__", "data": [Serializable.serialize(v) for v in obj]}
-		
-		# Primitives pass through
-		return obj
+		# Iterative walk. Each frame writes its result into parent[key], and
+		# children are pushed in reverse so they're visited in original order.
+		# Containers being expanded on the current path are tracked by id to
+		# catch circular references. Their exit frame keeps them alive, so ids
+		# can't be reused meanwhile.
+		root = [None]
+		stack = [(obj, root, 0)]
+		active = set()
+		
+		# Bind lookups used on every frame to locals
+		pop = stack.pop
+		push = stack.append
+		registry_get = _REGISTRY_BY_TYPE.get
+		encoders_get = _ENCODERS.get
+		expanders_get = _EXPANDERS.get
+		
+		while stack:
+			obj, parent, key = pop()
+			if obj is _EXIT:
+				active.discard(key)
+				continue
+			tp = type(obj)
+			
+			# Registered custom classes
+			info = registry_get(tp)
+			if info:
+				oid = id(obj)
+				if oid in active:
+					raise ValueError("circular reference")
+				active.add(oid)
+				push((_EXIT, obj, oid))
+				out = {
+					"__type__": tp.__name__,
+					"cls_serializer_version": info.version,     # per-class schema version
+					"state_data": None,
+				}
+				parent[key] = out
+				push((info.to(obj), out, "state_data"))
+				continue
+			
+			# Exact builtin/numpy types
+			encoder = encoders_get(tp)
+			if encoder is not None:
+				parent[key] = encoder(obj)
+				continue
+			expander = expanders_get(tp)
+			
+			# Subclasses of the types above
+			if expander is None:
+				if isinstance(obj, datetime):
+					parent[key] = _encode_datetime(obj)
+					continue
+				if isinstance(obj, np.generic):
+					push((obj.item(), parent, key))
+					continue
+				if isinstance(obj, np.ndarray):
+					parent[key] = _encode_ndarray(obj)
+					continue
+				if isinstance(obj, dict):
+					expander = _expand_dict
+				elif isinstance(obj, (list, tuple)):
+					expander = _expand_list
+				elif isinstance(obj, set):
+					expander = _expand_set
+				elif isinstance(obj, float):
+					parent[key] = _encode_float(obj)
+					continue
+				elif isinstance(obj, int) and tp is not bool:
+					parent[key] = _encode_int(obj)
+					continue
+				else:
+					# Primitives pass through
+					parent[key] = obj
+					continue
+			
+			# Containers
+			oid = id(obj)
+			if oid in active:
+				raise ValueError("circular reference")
+			active.add(oid)
+			push((_EXIT, obj, oid))
+			out, target, children = expander(obj)
+			parent[key] = out
+			for k, v in reversed(children):
+				push((v, target, k))
+		
+		return root[0]
 	
 	@staticmethod
 	def deserialize(obj:Any) -> Any:
 		
-		def _decode_datetime(obj: dict) -> datetime:
-			s = obj["data"]
-			# Accept either ...Z or ...+HH:MM
-			if s.endswith("Z"):
-				s = s.replace("Z", "+00:00")
-			dt = datetime.fromisoformat(s)
-			# If it was marked naive originally, drop tzinfo
-			if obj.get("naive"):
-				return dt.replace(tzinfo=None)
-			return dt
-
-		def _decode_ndarray(obj: dict):
-			if np is None:
-				# Fall back to plain nested lists if numpy isn't available at load time
-				return obj["data"]
-			arr = np.array(obj["data"], dtype=obj["dtype"])
-			return arr.reshape(tuple(obj["shape"]))
-		
-		# container-first walk
-		if isinstance(obj, list):
-			return [Serializable.deserialize(v) for v in obj]
-		if isinstance(obj, dict):
-			t = obj.get("__type__")
-			if t == "__set__":
-				return set(Serializable.deserialize(v) for v in obj["data"])
-			if t == "__datetime__":
-				return _decode_datetime(obj)
-			if t == "__ndarray__":
-				return _decode_ndarray(obj)
-
-			# Registered classes
-			if t and t in SERIALIZABLE_CLASS_REGISTRY:
-				info = SERIALIZABLE_CLASS_REGISTRY[t]
-				payload = Serializable.deserialize(obj["state_data"])  # decode inner payload first
-				from_version = int(obj.get("v", 1))
-				to_version = info.version
-				if from_version != to_version:
-					if info.upgrade:
-						payload = info.upgrade(payload, from_version, to_version)
-				return info.from_(payload)
-			elif valid_serialized_object(obj):
-				print(f"{Fore.RED}Warning:{Fore.WHITE} Skipping deserialization of Serializeable-formatted dictionary. Type {Fore.RED}{t}{Style.RESET_ALL} not in SERIALIZABLE_CLASS_REGISTRY.{Style.RESET_ALL}")
+		# Iterative walk, same layout as serialize. Frames with a finisher run
+		# after their children, and store finish(obj) in parent[key].
+		root = [None]
+		stack = [(obj, root, 0, None)]
+		active = set()
+		
+		# Bind lookups used on every frame to locals
+		pop = stack.pop
+		push = stack.append
+		decoders_get = _DECODERS.get
+		class_registry = SERIALIZABLE_CLASS_REGISTRY
+		
+		while stack:
+			obj, parent, key, finish = pop()
+			if finish is not None:
+				if finish is _EXIT:
+					active.discard(key)
+				else:
+					parent[key] = finish(obj)
+				continue
+			
+			# container-first walk. Exact builtin types are checked by identity,
+			# with isinstance only needed for subclasses.
+			tp = type(obj)
+			if tp is list or (tp is not dict and isinstance(obj, list)):
+				oid = id(obj)
+				if oid in active:
+					raise ValueError("circular reference")
+				active.add(oid)
+				push((obj, None, oid, _EXIT))
+				out = [None] * len(obj)
+				parent[key] = out
+				for i in range(len(obj) - 1, -1, -1):
+					push((obj[i], out, i, None))
+				continue
+			
+			if tp is dict or isinstance(obj, dict):
+				t = obj.get("__type__")
+				decoder = decoders_get(t)
+				if decoder is not None:
+					parent[key] = decoder(obj)
+					continue
 				
-			# Ordinary dict
-			return {k: Serializable.deserialize(v) for k, v in obj.items()}
-
-		# primitive
-		return obj
+				oid = id(obj)
+				if oid in active:
+					raise ValueError("circular reference")
+				active.add(oid)
+				push((obj, None, oid, _EXIT))
+				
+				if t == "__set__":
+					data = obj["data"]
+					buf = [None] * len(data)
+					push((buf, parent, key, _restore_set))
+					for i in range(len(data) - 1, -1, -1):
+						push((data[i], buf, i, None))
+					continue
+				
+				# Registered classes, decode inner payload first
+				if t and t in class_registry:
+					info = class_registry[t]
+					from_version = int(obj.get("v", 1))
+					holder = [None]
+					push((holder, parent, key, partial(_restore_registered, info, from_version)))
+					push((obj["state_data"], holder, 0, None))
+					continue
+				elif valid_serialized_object(obj):
+					print(f"{Fore.RED}Warning:{Fore.WHITE} Skipping deserialization of Serializeable-formatted dictionary. Type {Fore.RED}{t}{Style.RESET_ALL} not in SERIALIZABLE_CLASS_REGISTRY.{Style.RESET_ALL}")
+				
+				# Ordinary dict
+				out = dict.fromkeys(obj)
+				parent[key] = out
+				for k, v in reversed(list(obj.items())):
+					push((v, out, k, None))
+				continue
+			
+			# primitive
+			parent[key] = obj
+		
+		return root[0]
 
 class Packable(ABC):
 	""" This class represents all objects that can be packed and unpacked and sent between the client and server
@@ -331,8 +629,10 @@ class Packable(ABC):
 	manifest: lists all variables that can be converted to/from JSON natively
 	obj_manifest: lists all variables that are Packable objects or lists of packable objects. Each object will have
 		pack() called, and be understood through its unpack() function.
-	list_template: dictionary mapping item to pack/unpack to its class type, that way during unpack, Packable knows which
-		class to create and call unpack() on.
+	list_manifest/dict_manifest: dictionaries mapping the name of a list or dict of Packable objects to the class (or
+		a zero-argument factory) used to create each element, that way during unpack, Packable knows which class to
+		create and call unpack() on. Older code stored template instances here, which are still accepted but are
+		deep-copied for every element, so they should be migrated to classes.
 	
 	Populate all three of these variables as needed in the set_manifest function. set_manifest is called in super().__init__(), so
 	it shouldn't need to be remembered in any of the child classes.
@@ -360,6 +660,17 @@ class Packable(ABC):
 		""" This function will populate the manifest and obj_manifest objects"""
 		pass
 	
+	@staticmethod
+	def _new_manifest_item(factory):
+		""" Creates an empty object for a list_manifest or dict_manifest entry. """
+		
+		# Legacy template instance
+		if isinstance(factory, Packable):
+			return copy.deepcopy(factory)
+		
+		# Class or zero-argument factory
+		return factory()
+	
 	def pack(self):
 		""" Returns the object to as a JSON dictionary """
 		
@@ -382,7 +693,8 @@ class Packable(ABC):
 		for mi in self.list_manifest:
 				
 			# Pack objects in list and add to output data
-			d[mi] = [x.pack() for x in getattr(self, mi)]
+			mi_deref = getattr(self, mi)
+			d[mi] = [x.pack() for x in mi_deref]
 		
 		# Scan over dict manifest
 		for mi in self.dict_manifest:
@@ -390,9 +702,7 @@ class Packable(ABC):
 			mi_deref = getattr(self, mi)
 			
 			# Pack objects in dict and add to output data
-			d[mi] = {}
-			for midk in mi_deref.keys():
-				d[mi][midk] = mi_deref[midk].pack()
+			d[mi] = {midk: x.pack() for midk, x in mi_deref.items()}
 				
 		# Return data list
 		return d
@@ -400,52 +710,57 @@ class Packable(ABC):
 	def unpack(self, data:dict):
 		""" Populates the object from a JSON dict """
 		
+		log = self.log
+		new_manifest_item = self._new_manifest_item
+		
 		# Try to populate each item in manifest
 		for mi in self.manifest:
-			self.log.lowdebug(f"Unpacking manifest, item:>{mi}<")
+			log.lowdebug(f"Unpacking manifest, item:>{mi}<")
 			
 			# Try to assign the new value
 			try:
 				setattr(self, mi, data[mi])
 			except Exception as e:
-				self.log.error(f"Failed to unpack item in object of type '{type(self).__name__}'. ({e})", detail=f"Type = {type(self)}")
+				log.error(f"Failed to unpack item in object of type '{type(self).__name__}'. ({e})", detail=f"Type = {type(self)}")
 				return
 		
 		# Try to populate each Packable object in manifest
 		for mi in self.obj_manifest:
-			self.log.lowdebug(f"Unpacking obj_manifest, item:>{mi}<")
+			log.lowdebug(f"Unpacking obj_manifest, item:>{mi}<")
 			
 			# Try to update the object by unpacking the item
 			try:
 				getattr(self, mi).unpack(data[mi])
 			except Exception as e:
-				self.log.error(f"Failed to unpack Packable in object of type '{type(self).__name__}'. ({e})", detail=f"Type = {type(self)}")
+				log.error(f"Failed to unpack Packable in object of type '{type(self).__name__}'. ({e})", detail=f"Type = {type(self)}")
 				return
 			
 		# Try to populate each list of Packable objects in manifest
 		for mi in self.list_manifest.keys():
-				
+			factory = self.list_manifest[mi]
+			
 			# Scan over list, unpacking each element
 			temp_list = []
 			for list_item in data[mi]:
-				self.log.lowdebug(f"Unpacking list_manifest, item:>{mi}<, element:>:a{list_item}<")
+				log.lowdebug(f"Unpacking list_manifest, item:>{mi}<, element:>:a{list_item}<")
 				
 				# Try to create a new object and unpack a list element
 				try:
 					# Create a new object of the correct type
-					new_obj = copy.deepcopy(self.list_manifest[mi])
+					new_obj = new_manifest_item(factory)
 					
 					# Populate the new object by unpacking it, add to list
 					new_obj.unpack(list_item)
 					temp_list.append(new_obj)
 				except Exception as e:
-					self.log.error(f"Failed to unpack list of Packables in object of type '{type(self).__name__}'. Type={type(self)}. ({e})", detail=f"Type = {type(self)}")
+					log.error(f"Failed to unpack list of Packables in object of type '{type(self).__name__}'. Type={type(self)}. ({e})", detail=f"Type = {type(self)}")
 					return
 			setattr(self, mi, temp_list)
 				# self.obj_manifest[mi] = copy.deepcopy(temp_list)
 		
 		# Scan over dict manifest
 		for mi in self.dict_manifest.keys():
+			factory = self.dict_manifest[mi]
 			
 			# mi_deref = getattr(self, mi)
 			
@@ -455,17 +770,17 @@ class Packable(ABC):
 			# Scan over list, unpacking each element
 			temp_dict = {}
 			for dmk in data[mi].keys():
-				self.log.lowdebug(f"Unpacking manifest, item:>{mi}<, element:>:a{dmk}<")
+				log.lowdebug(f"Unpacking manifest, item:>{mi}<, element:>:a{dmk}<")
 				
 				# Try to create a new object and unpack a list element
 				try:
 					# Create a new object of the correct type
 					try:
-						new_obj = copy.deepcopy(self.dict_manifest[mi])
+						new_obj = new_manifest_item(factory)
 					except Exception as e:
 						print("Dict Manifest:")
 						print(self.dict_manifest)
-						self.log.error(f"Failed to unpack dict_manifest[{mi}], ({e})")
+						log.error(f"Failed to unpack dict_manifest[{mi}], ({e})")
 						return
 					
 					# Populate the new object by unpacking it, add to list
@@ -473,6 +788,6 @@ class Packable(ABC):
 					temp_dict[dmk] = new_obj
 				except Exception as e:
 					prob_item = data[mi][dmk]
-					self.log.error(f"Failed to unpack dict of Packables in object of type '{type(self).__name__}'. ({e})", detail=f"Class={type(self)}, problem manifest item=(name:{dmk}, type:{type(prob_item)})")
+					log.error(f"Failed to unpack dict of Packables in object of type '{type(self).__name__}'. ({e})", detail=f"Class={type(self)}, problem manifest item=(name:{dmk}, type:{type(prob_item)})")
 					return
 			setattr(self, mi, temp_dict)
\ No newline at end of file
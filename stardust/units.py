@@ -1,3 +1,4 @@
+import math
 import numpy as np
 
 def lin_to_dB(x_lin:float, use10:bool=False) -> float:
@@ -12,27 +13,34 @@ def lin_to_dB(x_lin:float, use10:bool=False) -> float:
 		(float): Value converted to dB
 	'''
 	
-	if use10:
-		return 10*np.log10(x_lin)
-	else:
-		return 20*np.log10(x_lin)
+	factor = 10 if use10 else 20
+	
+	# Skip numpy's ufunc dispatch for plain positive scalars
+	if type(x_lin) in (float, int) and x_lin > 0:
+		return factor*math.log10(x_lin)
+	return factor*np.log10(x_lin)
 
 def dB_to_lin(x_dB:float, use10:bool=False) -> float:
-	''' Converts a linear parameter to decibels. Will raise a warning if
-	negative numbers are provided.
+	''' Converts a value in decibels to a linear parameter.
 	
 	Args:
 		x_dB (float): Value in dB to convert to linear units.
 		use10 (bool): Use 10*log(X) definition instead of 20*log(X) definition. Default is false.
 	
 	Returns:
-		(float): Value converted to dB
+		(float): Value converted to linear units
 	'''
 	
-	if use10:
-		return np.log10(10, x_dB/10)
-	else:
-		return np.power(10, x_dB/20)
+	factor = 10 if use10 else 20
+	
+	# Skip numpy's ufunc dispatch for plain scalars. math.pow raises where
+	# numpy would overflow to inf.
+	if type(x_dB) in (float, int):
+		try:
+			return math.pow(10, x_dB/factor)
+		except OverflowError:
+			return math.inf
+	return np.power(10, np.asarray(x_dB)/factor)
 
 class UnitType:
 	